@@ -1,8 +1,9 @@
-from detail.core import Commit, Note, NoteRange, Notes, Tag, detail, lint, log
+from detail.core import Commit, CommitTable, Note, NoteRange, Notes, Tag, detail, lint, log
 from detail.version import __version__
 
 __all__ = [
     "Commit",
+    "CommitTable",
     "Note",
     "NoteRange",
     "Notes",
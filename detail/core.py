@@ -5,9 +5,16 @@ The core detail API
 from __future__ import annotations
 
 import collections.abc
+import concurrent.futures
 import datetime as dt
-import io
+import functools
+import gzip
+import hashlib
+import json
+import os
+import pathlib
 import re
+import shlex
 import subprocess
 import uuid
 from typing import Optional, Tuple
@@ -19,6 +26,11 @@ import yaml
 
 from detail import exceptions, github, utils
 
+# Use the libyaml bindings for parsing and dumping YAML when PyYAML
+# was built with them
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 # The default log Jinja template
 DEFAULT_LOG_TEMPLATE = """
 {% for tag, notes_by_tag in notes.group('commit_tag').items() %}
@@ -35,6 +47,8 @@ DEFAULT_LOG_TEMPLATE = """
 """
 # The special range value for git ranges against github pull requests
 GITHUB_PR = ":github/pr"
+# Set to "1" to skip fetching remotes before reading git logs
+NO_FETCH_ENV_VAR = "DETAIL_NO_FETCH"
 
 
 def _output(*, value, path):
@@ -60,63 +74,28 @@ def _output(*, value, path):
         path.flush()
 
 
-def _load_commit_schema(path=None, full=True):
-    """Loads the schema expected for parsed commit messages"""
-    schema = [
-        {
-            "label": "sha",
-            "name": "SHA",
-            "help": "Full SHA of the commit.",
-            "type": "string",
-        },
-        {
-            "label": "author_name",
-            "name": "Author Name",
-            "help": "The author name of the commit.",
-            "type": "string",
-        },
-        {
-            "label": "author_email",
-            "name": "Author Email",
-            "help": "The author email of the commit.",
-            "type": "string",
-        },
-        {
-            "label": "author_date",
-            "name": "Author Date",
-            "help": "The time at which the commit was authored.",
-            "type": "datetime",
-        },
-        {
-            "label": "committer_name",
-            "name": "Committer Name",
-            "help": "The name of the person who performed the commit.",
-            "type": "string",
-        },
-        {
-            "label": "committer_email",
-            "name": "Committer Email",
-            "help": "The email of the person who performed the commit.",
-            "type": "string",
-        },
-        {
-            "label": "committer_date",
-            "name": "Committer Date",
-            "help": "The time at which the commit was performed.",
-            "type": "datetime",
-        },
-    ]
-
-    return formaldict.Schema(schema)
-
-
 def _load_note_schema(path=None):
     """Loads the detail schema"""
     path = path or utils.get_detail_schema_path()
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        # Schemas that can't be read raise errors when loaded
+        mtime_ns = None
+
+    return _load_note_schema_cached(path, mtime_ns)
+
 
+@functools.lru_cache(maxsize=8)
+def _load_note_schema_cached(path, mtime_ns):
+    """
+    Loads and caches the detail schema at a path. The modification time
+    of the schema is part of the cache key so that edited schemas are
+    reloaded. Use `_load_note_schema` to load the schema.
+    """
     try:
-        with open(path, "r") as schema_f:
-            schema = yaml.safe_load(schema_f)
+        with open(path, "rb") as schema_f:
+            schema = yaml.load(schema_f, Loader=_YamlLoader)
     except IOError as exc:
         raise exceptions.SchemaError(
             'Must create a schema.yaml in the ".detail" directory of your project'
@@ -129,11 +108,13 @@ def _load_note_schema(path=None):
     return formaldict.Schema(schema)
 
 
-class Tag(collections.UserString):
+class Tag(str):
     """A git tag."""
 
-    def __init__(self, tag):
-        self.data = tag
+    @property
+    def data(self) -> str:
+        """The tag name"""
+        return str(self)
 
     @classmethod
     def from_sha(cls, sha, tag_match=None) -> Optional[Tag]:
@@ -144,16 +125,7 @@ class Tag(collections.UserString):
         Returns:
             A constructed tag or ``None`` if no tags contain the commit.
         """
-        describe_cmd = f"git describe {sha} --contains"
-        if tag_match:
-            describe_cmd += f" --match={tag_match}"
-
-        rev = (
-            utils.shell_stdout(describe_cmd, check=False, stderr=subprocess.PIPE)
-            .replace("~", ":")
-            .replace("^", ":")
-        )
-        return cls(rev.split(":")[0]) if rev else None
+        return _TagIndex([sha], tag_match=tag_match).tags.get(sha)
 
     @property
     def date(self) -> Optional[dt.datetime]:
@@ -164,68 +136,330 @@ class Tag(collections.UserString):
             The tag parsed as a datetime object.
         """
         if not hasattr(self, "_date"):
-            try:
-                self._date = dateutil.parser.parse(
-                    utils.shell_stdout(f"git log -1 --format=%ad {self}")
-                )
-            except dateutil.parser.ParserError:
-                self._date = None
+            self._date = _tag_dates([str(self)]).get(str(self))
 
         return self._date
 
 
-class Commit(collections.UserDict):
+def _parse_tag_name(rev):
+    """Parse the tag name from a revision name such as "v1.1~2^2" """
+    return rev.replace("~", ":").replace("^", ":").split(":")[0]
+
+
+def _parse_iso_date(value) -> Optional[dt.datetime]:
+    """
+    Parse an ISO 8601 date from git. The faster ``datetime.fromisoformat``
+    is tried before falling back to dateutil, which handles formats it
+    doesn't support on older Python versions (e.g. a "Z" suffix).
+    """
+    try:
+        return dt.datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            return dateutil.parser.parse(value)
+        except dateutil.parser.ParserError:
+            return None
+
+
+def _tag_dates(names=()):
+    """
+    Obtain the dates of all tags in the project. Dates are cached and
+    reloaded when any of ``names`` are missing, i.e. the tags were created
+    after the dates were cached.
+
+    Returns:
+        Dict[str, datetime]: Tag dates keyed on tag name.
+    """
+    root = utils.get_root()
+    tag_dates = _tag_dates_cached(root)
+    if not tag_dates.keys() >= set(names):
+        _tag_dates_cached.cache_clear()
+        tag_dates = _tag_dates_cached(root)
+
+    return tag_dates
+
+
+@functools.lru_cache(maxsize=None)
+def _tag_dates_cached(root):
+    """
+    Obtain the dates of all tags of a project in one git call. A tag date
+    is the author date of the commit it references. Use `_tag_dates` to
+    get the dates of the current project.
+    """
+    tag_dates = {}
+    for line in utils.git_stdout(
+        "for-each-ref",
+        "refs/tags",
+        "--format=%(refname:lstrip=2)%09%(*authordate:iso-strict)%09%(authordate:iso-strict)",
+    ).splitlines():
+        # Annotated tags are peeled to obtain the date of the referenced commit
+        name, _, dates = line.partition("\t")
+        peeled_authordate, _, authordate = dates.partition("\t")
+        tag_dates[name] = _parse_iso_date(peeled_authordate or authordate)
+
+    return tag_dates
+
+
+class _TagIndex:
+    """
+    Finds the tags that contain a group of commits. Tags are resolved
+    in a batch the first time they are accessed, avoiding a
+    ``git describe`` call for every commit. Commits with the same tag
+    share one `Tag`.
+    """
+
+    # The maximum amount of shas passed to a single "git name-rev" call.
+    # Keeps the command line within the limits of all platforms
+    batch_size = 512
+
+    def __init__(self, shas, tag_match=None):
+        self._shas = dict.fromkeys(shas)
+        self._tag_match = tag_match
+
+    def __contains__(self, sha):
+        return sha in self._shas
+
+    def _name_rev(self, args, shas):
+        """Run "git name-rev", returning one revision name per sha"""
+        # Shas that cannot be resolved are skipped with a message on stderr
+        revs = utils.git_stdout(*args, *shas, check=False, stderr=subprocess.PIPE).splitlines()
+        if len(revs) == len(shas):
+            return revs
+        elif len(shas) == 1:
+            return ["undefined"]
+        else:
+            # Resolve shas one at a time so that names stay aligned with shas
+            return [self._name_rev(args, [sha])[0] for sha in shas]
+
+    @functools.cached_property
+    def tags(self):
+        """Tags keyed on the shas of commits they contain"""
+        name_rev_args = ["name-rev", "--name-only", "--tags"]
+        if self._tag_match:
+            name_rev_args.append(f"--refs=refs/tags/{self._tag_match}")
+
+        # "git describe --contains" is a wrapper around "git name-rev",
+        # so this results in the same tags
+        tag_names = {}
+        shas = list(self._shas)
+        for i in range(0, len(shas), self.batch_size):
+            batch = shas[i : i + self.batch_size]
+            revs = self._name_rev(name_rev_args, batch)
+            tag_names.update(
+                (sha, _parse_tag_name(rev)) for sha, rev in zip(batch, revs) if rev != "undefined"
+            )
+
+        # Dates are only loaded by "Tag.date" when they are read
+        tags = {name: Tag(name) for name in set(tag_names.values())}
+        return {sha: tags[name] for sha, name in tag_names.items()}
+
+
+# The "git log --format" placeholders of commit attributes
+_COMMIT_FORMATS = {
+    "sha": "%H",
+    "author_name": "%an",
+    "author_email": "%ae",
+    "author_date": "%ad",
+    "committer_name": "%cn",
+    "committer_email": "%ce",
+    "committer_date": "%cd",
+}
+
+# Maps the "commit_*" attributes of notes to commit attributes
+_NOTE_COMMIT_ATTRS = {f"commit_{field}": field for field in _COMMIT_FORMATS}
+
+
+class CommitTable(collections.abc.Mapping):
+    """
+    The commits of a git log, keyed on sha. Commit data is stored as
+    one list per commit attribute, and accessing a commit returns a
+    `Commit` view of its row. The same view is returned every time a
+    commit is accessed.
+
+    Tables can be created with a subset of fields. The remaining fields
+    are loaded for the table's shas when first accessed.
+    """
+
+    fields = tuple(_COMMIT_FORMATS)
+
+    # The maximum amount of shas passed to a single "git log" call when
+    # loading fields
+    batch_size = 512
+
+    def __init__(self, fields=None, tag_match=None, tag_index=None):
+        fields = fields or self.fields
+        self.columns = {field: [] for field in self.fields if field == "sha" or field in fields}
+        self.index = {}
+        self.tag_match = tag_match
+        self.tag_index = tag_index
+        # Commit views are shared by every note of a commit
+        self._commits = {}
+
+    def column(self, field):
+        """Get the values of a field, loading them if needed"""
+        if field not in self.columns:
+            missing = [name for name in self.fields if name not in self.columns]
+            columns = {name: [None] * len(self.index) for name in missing}
+            # Load the exact shas of the table since the log that created it
+            # may return other commits by now (e.g. if HEAD moved)
+            shas = list(self.index)
+            for i in range(0, len(shas), self.batch_size):
+                git_log_cmd = [
+                    "--no-pager",
+                    "log",
+                    "--no-walk=unsorted",
+                    *shas[i : i + self.batch_size],
+                ]
+                for data, _ in _parse_git_log(git_log_cmd, ["sha", *missing]):
+                    for name in missing:
+                        columns[name][self.index[data["sha"]]] = data.get(name)
+
+            self.columns.update(columns)
+
+        return self.columns[field]
+
+    def append(self, data) -> int:
+        """Append commit data to the table and return its row"""
+        row = len(self.index)
+        for field, column in self.columns.items():
+            column.append(data.get(field))
+
+        self.index[data["sha"]] = row
+        return row
+
+    def __getitem__(self, sha) -> Commit:
+        if sha not in self._commits:
+            self._commits[sha] = Commit(table=self, row=self.index[sha])
+
+        return self._commits[sha]
+
+    def __len__(self):
+        return len(self.index)
+
+    def __iter__(self):
+        return iter(self.index)
+
+
+class Commit(collections.abc.Mapping):
     """
     A commit object, parsed from a dictionary of formatted
     commit data. Allows one to easily see the tag.
+
+    Commits of a `NoteRange` are views over a row of its `CommitTable`.
     """
 
-    def __init__(self, data, tag_match=None):
-        self.data = data
-        self._tag_match = tag_match
+    __slots__ = ("_table", "_row", "_tag")
 
-    def __getattribute__(self, attr):
-        try:
-            return object.__getattribute__(self, attr)
-        except AttributeError:
-            if attr in self.data:
-                return self.data[attr]
-            else:
-                raise
+    def __init__(self, data=None, tag_match=None, tag_index=None, *, table=None, row=None):
+        if table is None:
+            table = CommitTable(tag_match=tag_match, tag_index=tag_index)
+            row = table.append(data)
+
+        self._table = table
+        self._row = row
+
+    @property
+    def data(self):
+        """The commit data as a dictionary"""
+        return dict(self)
+
+    def __getitem__(self, key):
+        if key not in self._table.fields:
+            raise KeyError(key)
+
+        return self._table.column(key)[self._row]
+
+    def __len__(self):
+        return len(self._table.fields)
+
+    def __iter__(self):
+        return iter(self._table.fields)
+
+    def __getattr__(self, attr):
+        # Private attributes are looked up when slots are unset (e.g. when
+        # copying) and would recurse through "self._table"
+        if not attr.startswith("_") and attr in self._table.fields:
+            return self._table.column(attr)[self._row]
+        else:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{attr}'")
 
     @property
     def tag(self):
         """Returns a `Tag` that contains the commit"""
         if not hasattr(self, "_tag"):
-            self._tag = Tag.from_sha(self.sha, tag_match=self._tag_match)
+            tag_index = self._table.tag_index
+            if tag_index is not None and self.sha in tag_index:
+                self._tag = tag_index.tags.get(self.sha)
+            else:
+                self._tag = Tag.from_sha(self.sha, tag_match=self._table.tag_match)
 
         return self._tag
 
 
-class Note(collections.UserDict):
+class Note(collections.abc.Mapping):
     """
     A note object with an optional associated commit
     """
 
+    __slots__ = ("data", "path", "commit", "_schema", "_schema_data")
+
+    # Schema labels that are stored in slots once accessed. See `_note_class`
+    _label_slots = frozenset()
+
     def __init__(self, data, *, path, schema, commit=None):
         self.data = data
         self.path = path
-        self._schema = schema
         self.commit = commit
-        self.schema_data = schema.parse(data)
+        self._schema = schema
+        self._schema_data = None
 
-    def __getattribute__(self, attr):
-        try:
-            return object.__getattribute__(self, attr)
-        except AttributeError:
-            if self.schema_data and attr in self.schema_data:
-                return self.schema_data[attr]
-            elif attr in self._schema:
-                return None
-            elif self.commit and attr.startswith("commit_") and hasattr(self.commit, attr[7:]):
-                return getattr(self.commit, attr[7:])
-            else:
-                raise
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __len__(self):
+        return len(self.data)
+
+    def __iter__(self):
+        return iter(self.data)
+
+    @property
+    def schema_data(self) -> formaldict.FormalDict:
+        """
+        The note data parsed by the schema. Parsing happens on first access
+        so that notes which are never inspected are never validated.
+        """
+        if self._schema_data is None:
+            self._schema_data = self._schema.parse(self.data)
+
+        return self._schema_data
+
+    def __getattr__(self, attr):
+        if attr.startswith("_"):
+            # Private attributes are looked up when slots are unset (e.g. when
+            # copying) and would recurse through "self.schema_data"
+            pass
+        elif attr in self._label_slots:
+            value = self.schema_data.get(attr) if self.schema_data else None
+            setattr(self, attr, value)
+            return value
+        elif self.schema_data and attr in self.schema_data:
+            return self.schema_data[attr]
+        elif attr in self._schema:
+            return None
+        elif self.commit is not None and attr in _NOTE_COMMIT_ATTRS:
+            return self.commit[_NOTE_COMMIT_ATTRS[attr]]
+        elif self.commit and attr.startswith("commit_") and hasattr(self.commit, attr[7:]):
+            return getattr(self.commit, attr[7:])
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{attr}'")
+
+    def __reduce__(self):
+        # Classes made by `_note_class` can't be imported by pickle, so notes
+        # are rebuilt through it
+        return (
+            _rebuild_note,
+            (type(self) is not Note, self.data, self.path, self._schema, self.commit),
+        )
 
     @property
     def validation_errors(self):
@@ -245,13 +479,64 @@ class Note(collections.UserDict):
         return self.schema_data.is_valid
 
 
+@functools.lru_cache(maxsize=8)
+def _note_class(schema):
+    """
+    Create a `Note` class for a schema. Schema labels are stored in slots
+    the first time they are accessed, making later access as fast as any
+    other attribute. Labels that aren't identifiers or that would shadow
+    `Note` attributes are still looked up by ``Note.__getattr__``.
+    """
+    labels = tuple(
+        dict.fromkeys(
+            entry["label"]
+            for entry in schema
+            if entry["label"].isidentifier()
+            and not entry["label"].startswith("_")
+            and not hasattr(Note, entry["label"])
+        )
+    )
+    return type(
+        Note.__name__,
+        (Note,),
+        {"__slots__": labels, "__module__": __name__, "_label_slots": frozenset(labels)},
+    )
+
+
+def _rebuild_note(slotted, data, path, schema, commit):
+    """Rebuild a pickled `Note`, using the `_note_class` of its schema if it had one"""
+    note_class = _note_class(schema) if slotted else Note
+    return note_class(data, path=path, schema=schema, commit=commit)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern):
+    """Compile a regex pattern. Templates often filter with the same pattern in a loop"""
+    # Patterns are only used with re.match, where a trailing ".*" can always
+    # match an empty string. Dropping it avoids scanning the rest of the line
+    while pattern.endswith(".*") and not _is_escaped(pattern, len(pattern) - 2):
+        pattern = pattern[:-2]
+
+    return re.compile(pattern)
+
+
+def _is_escaped(pattern, i):
+    """True if the character at an index of a pattern is escaped with a backslash"""
+    num_backslashes = len(pattern[:i]) - len(pattern[:i].rstrip("\\"))
+    return num_backslashes % 2 == 1
+
+
 def _equals(a, b, match=False):
     """True if a equals b. If match is True, perform a regex match
 
     If b is a regex ``Pattern``, applies regex matching
     """
     if match:
-        return re.match(b, a) is not None if isinstance(a, str) else False
+        if not isinstance(a, str):
+            return False
+
+        pattern = b if isinstance(b, re.Pattern) else _compile_pattern(b)
+        return pattern.match(a) is not None
     else:
         return a == b
 
@@ -266,7 +551,26 @@ class Notes(collections.abc.Sequence):
     """
 
     def __init__(self, notes):
-        self._notes = notes
+        # Notes can be given as a callable that returns them, deferring work
+        # such as filtering until the notes are first accessed
+        self._source = notes
+        # Attribute values of the notes, keyed on attribute name
+        self._columns = {}
+        # Grouped notes in their natural key order, keyed on attribute name
+        self._groups = {}
+        # Notes selected from other notes reuse the attribute values of their
+        # parent so that chained calls on the same attribute don't look it up again
+        self._parent = None
+        self._indices = None
+
+    def _load(self):
+        """Load the notes if they were given as a callable"""
+        if callable(self._source):
+            self._source = self._source()
+
+        return self._source
+
+    _notes = property(_load)
 
     def __getitem__(self, i):
         return self._notes[i]
@@ -274,6 +578,41 @@ class Notes(collections.abc.Sequence):
     def __len__(self):
         return len(self._notes)
 
+    def _cached_column(self, attr):
+        """
+        Get the values of an attribute that were already looked up by the
+        notes or the notes they were selected from
+        """
+        if attr not in self._columns and self._parent is not None:
+            parent_column = self._parent._cached_column(attr)
+            if parent_column is not None:
+                self._load()  # Selects the indices
+                self._columns[attr] = [parent_column[i] for i in self._indices]
+
+        return self._columns.get(attr)
+
+    def _column(self, attr):
+        """Get the value of an attribute for every note"""
+        if self._cached_column(attr) is None:
+            self._columns[attr] = [getattr(note, attr) for note in self._notes]
+
+        return self._columns[attr]
+
+    def _select(self, indices) -> Notes:
+        """
+        Create notes from the notes at the given indices. ``indices`` can be
+        a callable that returns them, deferring the selection until the
+        notes are accessed
+        """
+
+        def select():
+            selected._indices = indices() if callable(indices) else indices
+            return [self._notes[i] for i in selected._indices]
+
+        selected = Notes(select)
+        selected._parent = self
+        return selected
+
     def filter(self, attr, value, match=False) -> Notes:
         """Filter notes by an attribute
 
@@ -286,7 +625,11 @@ class Notes(collections.abc.Sequence):
         Returns:
             The filtered notes.
         """
-        return Notes([note for note in self if _equals(getattr(note, attr), value, match=match)])
+        return self._select(
+            lambda: [
+                i for i, val in enumerate(self._column(attr)) if _equals(val, value, match=match)
+            ]
+        )
 
     def exclude(self, attr, value, match=False) -> Notes:
         """Exclude notes by an attribute
@@ -300,8 +643,12 @@ class Notes(collections.abc.Sequence):
         Returns:
             The excluded commits.
         """
-        return Notes(
-            [note for note in self if not _equals(getattr(note, attr), value, match=match)]
+        return self._select(
+            lambda: [
+                i
+                for i, val in enumerate(self._column(attr))
+                if not _equals(val, value, match=match)
+            ]
         )
 
     def group(
@@ -330,8 +677,18 @@ class Notes(collections.abc.Sequence):
             # If keys are sorted, default to making the "None" key last
             none_key_last = True
 
-        # Get the natural ordering of the keys
-        keys = list(collections.OrderedDict((getattr(note, attr), True) for note in self).keys())
+        if attr not in self._groups:
+            # Bucket the notes in one pass, keeping the natural ordering of the keys
+            buckets = collections.OrderedDict()
+            for i, key in enumerate(self._column(attr)):
+                buckets.setdefault(key, []).append(i)
+
+            self._groups[attr] = collections.OrderedDict(
+                (key, self._select(indices)) for key, indices in buckets.items()
+            )
+
+        groups = self._groups[attr]
+        keys = list(groups)
 
         # Re-sort the keys
         if any([ascending_keys, descending_keys]):
@@ -346,7 +703,7 @@ class Notes(collections.abc.Sequence):
             keys.remove(None)
             keys.insert(0 if none_key_first else len(keys), None)
 
-        return collections.OrderedDict((key, self.filter(attr, key)) for key in keys)
+        return collections.OrderedDict((key, groups[key]) for key in keys)
 
 
 def _get_pull_request_range():
@@ -354,81 +711,239 @@ def _get_pull_request_range():
     return f"{base}.."
 
 
-def _git_log(git_log_cmd):
+def _parse_git_log(git_log_cmd, fields, raw=False, paths=None):
     """
-    Outputs git log in a format parseable as YAML.
+    Runs git log and parses commit attributes from it.
 
     Args:
-        git_log_cmd (str): The primary "git log .." command.
-            This function adds the "--format" parameter to
-            it and cleans the resulting log.
+        git_log_cmd (List[str]): The git arguments of the primary
+            "log .." command. This function adds the "--format" parameter (and "--raw"
+            if requested) to it and cleans the resulting log.
+        fields (List[str]): The `CommitTable` fields to parse.
+        raw (bool, default=False): Include "git log --raw" output.
+        paths (List[str], default=None): Limit the log to these paths.
 
     Returns:
-        List: Commit dictionaries
-    """
-    delimiter = "\n<-------->"
-    git_log_stdout = utils.shell_stdout(
-        f"{git_log_cmd} "
-        '--format="'
-        "sha: %H%n"
-        "author_name: %an%n"
-        "author_email: %ae%n"
-        "author_date: %ad%n"
-        "committer_name: %cn%n"
-        "committer_email: %ce%n"
-        "committer_date: %cd%n"
-        f'%n{delimiter}"'
+        List[Tuple[dict, str]]: The parsed attributes of every commit along
+        with its raw output.
+    """
+    delimiter = "<-------->"
+    git_log_format = "%n".join(f"{field}: {_COMMIT_FORMATS[field]}" for field in fields)
+    git_log_stdout = utils.git_stdout(
+        *git_log_cmd,
+        f"--format={delimiter}%n{git_log_format}",
+        *(["--raw"] if raw else []),
+        *(["--", *paths] if paths else []),
     )
 
-    commit_schema = _load_commit_schema()
-    return [
-        commit_schema.parse(yaml.safe_load(io.StringIO(msg))).data
-        for msg in git_log_stdout.split(delimiter)
-        if msg.strip()
-    ]
+    commits = []
+    for msg in git_log_stdout.split(delimiter):
+        if not msg.strip():
+            continue
+
+        header, _, raw_output = msg.strip().partition("\n\n")
+
+        # Header lines are "key: value" pairs with known keys. Values such as
+        # author names are single-line, so they are split directly instead of
+        # being parsed as YAML
+        data = {}
+        for line in header.splitlines():
+            key, _, value = line.partition(":")
+            data[key.strip()] = value.strip()
 
+        commits.append((data, raw_output))
 
-def _note_log(git_log_cmd):
+    return commits
+
+
+def _range_git_log(git_log_cmd, fields=None):
     """
-    Return the notes and the associated SHAs of when they were created.
+    Outputs the commits of a git log along with the notes added in each
+    commit.
+
+    Two logs are run. Commit data comes from a log without diff output,
+    and notes come from a log limited to the note root. A single log that
+    also lists notes would have to diff the tree of every commit, which
+    is much slower on large histories.
 
     Args:
-        git_log_cmd (str): The primary "git log .." command.
-            This function adds additional parsing parameters and cleans
-            the log.
+        git_log_cmd (List[str]): The git arguments of the primary
+            "log .." command.
+        fields (List[str], default=None): The `CommitTable` fields to load.
+            Defaults to all fields. Other fields are loaded by the table
+            when accessed.
 
     Returns:
-        Dict: The file paths for each git sha
+        Tuple[CommitTable, List]: The commits and a list of
+        ``(file_path, sha)`` tuples for every note added in the log.
     """
-    delimiter = "<-------->"
-    git_log_stdout = utils.shell_stdout(
-        f"{git_log_cmd} "
-        f'--format="{delimiter}sha: %H"'
-        f" --diff-filter=A --raw -- {utils.get_detail_note_root()}"
+    commits = CommitTable(fields=fields)
+    for data, _ in _parse_git_log(git_log_cmd, commits.columns):
+        commits.append(data)
+
+    note_paths = []
+    for data, raw in _parse_git_log(
+        [*git_log_cmd, "--diff-filter=A"],
+        ["sha"],
+        raw=True,
+        paths=[str(utils.get_detail_note_root())],
+    ):
+        for line in raw.splitlines():
+            # Raw lines are formatted as ":<modes> <shas> <status>\t<path>"
+            _, _, file_path = line.partition("\t")
+            note_paths.append((file_path, data["sha"]))
+
+    return commits, note_paths
+
+
+# Bump when the format of cached git logs changes
+_GIT_LOG_CACHE_VERSION = 1
+# The maximum number of git logs kept in the cache
+_GIT_LOG_CACHE_SIZE = 16
+
+
+def _git_log_cache_path(git_log_cmd, revisions, fields):
+    """
+    Get the cache file of a git log. The cache key includes the shas that
+    the revisions of the log resolve to, so the cache is invalidated when
+    any branch or tag in the range moves. The shallow commits of the
+    repository are also included since deepening a shallow clone changes
+    the log without moving any revision.
+    """
+    is_shallow, shallow_path, shas = utils.git_stdout(
+        "rev-parse", "--is-shallow-repository", "--git-path", "shallow", *(revisions or ["HEAD"])
+    ).split("\n", 2)
+    shallow = pathlib.Path(shallow_path).read_text() if is_shallow == "true" else ""
+
+    key = json.dumps(
+        [
+            _GIT_LOG_CACHE_VERSION,
+            shas,
+            shallow,
+            git_log_cmd,
+            fields,
+            str(utils.get_detail_note_root().resolve()),
+        ]
     )
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return utils.get_detail_root() / ".cache" / f"{digest}.json.gz"
+
+
+def _write_git_log_cache(cache_path, commits, note_paths):
+    """Write a git log to the cache, ignoring unwritable caches"""
+    cache_dir = cache_path.parent
+    try:
+        # Projects without a detail root are not cached. Creating only the
+        # cache directory raises when the detail root is missing
+        cache_dir.mkdir(exist_ok=True)
+        gitignore_path = cache_dir / ".gitignore"
+        if not gitignore_path.exists():
+            gitignore_path.write_text("*\n")
+
+        tmp_path = cache_path.with_name(f"{uuid.uuid4()}.tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump({"columns": commits.columns, "note_paths": note_paths}, f)
+        os.replace(tmp_path, cache_path)
+
+        cached = sorted(cache_dir.glob("*.json.gz"), key=lambda path: path.stat().st_mtime)
+        for path in cached[:-_GIT_LOG_CACHE_SIZE]:
+            path.unlink()
+    except OSError:
+        pass
+
+
+def _cached_range_git_log(git_log_cmd, revisions, fields=None):
+    """
+    Outputs the results of `_range_git_log`, caching them in the
+    ".cache" directory of the detail root.
+
+    Args:
+        git_log_cmd (List[str]): The git arguments of the primary
+            "log .." command.
+        revisions (List[str]): The revisions of the range in the log.
+        fields (List[str], default=None): The `CommitTable` fields to load.
+
+    Returns:
+        Tuple[CommitTable, List]: The commits and a list of
+        ``(file_path, sha)`` tuples for every note added in the log.
+    """
+    cache_path = _git_log_cache_path(git_log_cmd, revisions, fields)
+    try:
+        with gzip.open(cache_path, "rt", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, EOFError, ValueError):
+        cached = None
+
+    if cached:
+        columns = cached["columns"]
+        commits = CommitTable(fields=list(columns))
+        for values in zip(*columns.values()):
+            commits.append(dict(zip(columns, values)))
 
-    shas_to_files = {}
-    msgs = [msg for msg in git_log_stdout.split(delimiter) if msg]
-    for msg in msgs:
-        split = msg.split("\n")
-        sha = split[0][4:].strip()
-        files = [line.split("\t")[1].strip() for line in split[1:] if line.strip()]
-        shas_to_files[sha] = files
+        return commits, [tuple(note_path) for note_path in cached["note_paths"]]
 
-    notes = []
+    commits, note_paths = _range_git_log(git_log_cmd, fields=fields)
+    _write_git_log_cache(cache_path, commits, note_paths)
+    return commits, note_paths
+
+
+# Notes are parsed in a process pool when a range has more notes than
+# this. Below it, starting the worker processes costs more than it saves
+_PARALLEL_NOTE_THRESHOLD = 512
+
+
+def _load_note(path):
+    """
+    Load the contents of a note file.
+
+    Returns:
+        Tuple[bool, Any]: Whether the note exists and its parsed contents.
+    """
+    try:
+        # Notes are parsed from bytes, letting the loader decode them as
+        # UTF-8 (or per their BOM) instead of with the locale encoding
+        with open(path, "rb") as f:
+            return True, yaml.load(f, Loader=_YamlLoader)
+    except FileNotFoundError:
+        return False, None
+
+
+def _load_notes(note_paths):
+    """
+    Load the contents of notes. Large amounts of notes are parsed in
+    parallel.
+
+    Args:
+        note_paths (List): ``(file_path, sha)`` tuples of notes.
+
+    Returns:
+        List: ``(file_path, parsed_contents, sha)`` tuples of every note
+        that still exists in the project.
+    """
     root = utils.get_root()
-    for sha, files in shas_to_files.items():
-        for file_path in files:
-            try:
-                with open(root / file_path) as f:
-                    file_contents = f.read()
-            except FileNotFoundError:
-                continue
+    paths = [root / file_path for file_path, _ in note_paths]
+    if len(paths) > _PARALLEL_NOTE_THRESHOLD:
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            loaded = list(executor.map(_load_note, paths, chunksize=64))
+    else:
+        loaded = [_load_note(path) for path in paths]
+
+    return [
+        (file_path, parsed_contents, sha)
+        for (file_path, sha), (exists, parsed_contents) in zip(note_paths, loaded)
+        if exists
+    ]
+
+
+def _fetch():
+    """Start fetching remotes in the background"""
+    return subprocess.Popen(["git", "--no-pager", "fetch", "-q"])
 
-            parsed_contents = yaml.safe_load(file_contents)
-            notes.append((file_path, parsed_contents, sha))
 
-    return notes
+def _wait_for_fetch(fetch):
+    """Wait for a background fetch, raising if it failed"""
+    if fetch.wait():
+        raise subprocess.CalledProcessError(fetch.returncode, fetch.args)
 
 
 class NoteRange(Notes):
@@ -443,10 +958,26 @@ class NoteRange(Notes):
     If the special ``:github/pr`` value is used as a range, the Github
     API is used to figure out the range based on a pull request opened
     from the current branch (if found).
+
+    ``commit_fields`` limits the `CommitTable` fields that are initially
+    loaded for ``NoteRange.commits``. Other fields are loaded on access.
+
+    Remotes are fetched before the range is resolved unless the
+    ``DETAIL_NO_FETCH`` environment variable is set to "1".
     """
 
-    def __init__(self, range="", tag_match=None, before=None, after=None, reverse=False):
-        self._commit_schema = _load_commit_schema()
+    def __init__(
+        self,
+        range="",
+        tag_match=None,
+        before=None,
+        after=None,
+        reverse=False,
+        commit_fields=None,
+    ):
+        # Load the schema first so that projects without one fail before
+        # fetching or reading the log
+        schema = _load_note_schema()
         self._tag_match = tag_match
         self._before = before
         self._after = after
@@ -457,33 +988,60 @@ class NoteRange(Notes):
         if range == GITHUB_PR:
             range = _get_pull_request_range()
 
-        # Ensure any remotes are fetched
-        utils.shell("git --no-pager fetch -q")
+        # Ensure any remotes are fetched. Ranges may reference refs that only
+        # exist after the fetch (remote branches, tags, FETCH_HEAD, "@{u}"), so
+        # the fetch only runs in the background of the log for the default range
+        fetch = _fetch() if os.environ.get(NO_FETCH_ENV_VAR) != "1" else None
+        try:
+            if fetch and range:
+                _wait_for_fetch(fetch)
+
+            revisions = shlex.split(range)
+            git_log_cmd = ["--no-pager", "log", *revisions, "--no-merges"]
+            if before:
+                git_log_cmd.append(f"--before={before}")
+            if after:
+                git_log_cmd.append(f"--after={after}")
+            if reverse:
+                git_log_cmd.append("--reverse")
+
+            if before or after or any(revision.startswith("-") for revision in revisions):
+                # Relative dates (e.g. "2 weeks ago") change over time, so logs
+                # filtered by date are not cached. Neither are ranges with log
+                # options (e.g. "--since"), which may filter by date
+                self.commits, note_paths = _range_git_log(git_log_cmd, fields=commit_fields)
+            else:
+                self.commits, note_paths = _cached_range_git_log(
+                    git_log_cmd, revisions, fields=commit_fields
+                )
 
-        git_log_cmd = f"git --no-pager log {range} --no-merges"
-        if before:
-            git_log_cmd += f" --before={before}"
-        if after:
-            git_log_cmd += f" --after={after}"
-        if reverse:
-            git_log_cmd += " --reverse"
+            if fetch:
+                _wait_for_fetch(fetch)
+        finally:
+            # Don't leave the fetch running when resolving the range fails
+            if fetch and fetch.returncode is None:
+                fetch.terminate()
+                fetch.wait()
 
-        self.commits = {commit["sha"]: commit for commit in _git_log(git_log_cmd)}
-        note_log = _note_log(git_log_cmd)
+        note_log = _load_notes(note_paths)
 
         self._range = range
-        schema = _load_note_schema()
+        note_log = [(path, data, sha) for path, data, sha in note_log if data]
+        self.commits.tag_match = tag_match
+        self.commits.tag_index = _TagIndex(
+            dict.fromkeys(sha for _, _, sha in note_log), tag_match=tag_match
+        )
 
+        note_class = _note_class(schema)
         return super().__init__(
             [
-                Note(
+                note_class(
                     data,
                     path=path,
                     schema=schema,
-                    commit=Commit(self.commits[sha], tag_match=tag_match),
+                    commit=self.commits[sha],
                 )
                 for path, data, sha in note_log
-                if data
             ]
         )
 
@@ -502,8 +1060,8 @@ def detail(path: Optional[str] = None) -> Tuple[str, formaldict.FormalDict]:
     """
     defaults = {}
     if path:
-        with open(path) as f:
-            defaults = yaml.safe_load(f.read())
+        with open(path, "rb") as f:
+            defaults = yaml.load(f, Loader=_YamlLoader)
     else:
         now = dt.datetime.now(dt.timezone.utc)
         autopath = (
@@ -515,7 +1073,7 @@ def detail(path: Optional[str] = None) -> Tuple[str, formaldict.FormalDict]:
 
     schema = _load_note_schema()
     entry = schema.prompt(defaults=defaults)
-    serialized = yaml.dump(entry.data, default_style="|")
+    serialized = yaml.dump(entry.data, default_style="|", Dumper=_YamlDumper)
 
     with open(path, "w") as f:
         f.write(serialized)
@@ -550,7 +1108,9 @@ def lint(range="") -> Tuple[bool, Notes]:
         tuple(bool, NoteRange): A tuple of the lint result (True/False)
         and the associated `NoteRange`
     """
-    notes = NoteRange(range=range)
+    # Linting only needs commit shas. Other commit attributes are loaded
+    # if they are accessed
+    notes = NoteRange(range=range, commit_fields=["sha"])
     if not notes.commits:
         return True, notes
     elif not notes:
@@ -559,6 +1119,31 @@ def lint(range="") -> Tuple[bool, Notes]:
         return not notes.filter("is_valid", False), notes
 
 
+@functools.lru_cache(maxsize=None)
+def _get_log_environment(detail_root):
+    """
+    Get the Jinja environment for log templates in a detail root. Environments
+    are reused so that templates are only compiled once per process.
+
+    The default log template is used when the project has no "log.tpl".
+    """
+    return jinja2.Environment(
+        loader=jinja2.ChoiceLoader(
+            [
+                jinja2.FileSystemLoader(detail_root),
+                jinja2.DictLoader({"log.tpl": DEFAULT_LOG_TEMPLATE}),
+            ]
+        ),
+        trim_blocks=True,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_log_template(template):
+    """Compile a log template string"""
+    return jinja2.Template(template, trim_blocks=True)
+
+
 def log(
     range="",
     style="default",
@@ -614,22 +1199,11 @@ def log(
     )
 
     if not template:
-        env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(utils.get_detail_root()),
-            trim_blocks=True,
-        )
+        env = _get_log_environment(utils.get_detail_root())
         template_file = "log.tpl" if style == "default" else f"log_{style}.tpl"
-
-        try:
-            template = env.get_template(template_file)
-        except jinja2.exceptions.TemplateNotFound:
-            if style == "default":
-                # Use the default template if the user didn't provide one
-                template = jinja2.Template(DEFAULT_LOG_TEMPLATE, trim_blocks=True)
-            else:
-                raise
+        template = env.get_template(template_file)
     else:
-        template = jinja2.Template(template, trim_blocks=True)
+        template = _compile_log_template(template)
 
     rendered = template.render(notes=notes, output=output, range=range)
 
@@ -13,7 +13,7 @@ GITHUB_USERNAME_ENV_VAR = "GITHUB_USERNAME"
 
 
 def get_org_and_repo_name():
-    remote_url = utils.shell_stdout("git remote get-url origin")
+    remote_url = utils.git_stdout("remote", "get-url", "origin")
     if not remote_url:
         raise exceptions.GithubConfigurationError(
             'Must have a remote named "origin" in order to work with Github.'
@@ -73,7 +73,7 @@ def get_pull_request():
             opened from the current branch
     """
     org_name, repo_name = get_org_and_repo_name()
-    current_branch = utils.shell_stdout("git --no-pager branch | grep \\* | cut -d ' ' -f2")
+    current_branch = utils.git_stdout("rev-parse", "--abbrev-ref", "HEAD")
 
     try:
         prs = (
@@ -0,0 +1,15 @@
+"""Shared fixtures for detail tests"""
+
+import pytest
+
+from detail import core, utils
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Clears cached git project data between tests"""
+    utils._get_root.cache_clear()
+    core._tag_dates_cached.cache_clear()
+    yield
+    utils._get_root.cache_clear()
+    core._tag_dates_cached.cache_clear()
@@ -4,9 +4,16 @@ Most of the test coverage of the core module is from the integration
 tests in detail/tests/test_integration.py.
 """
 
+import copy
+import os
+import pathlib
+import pickle
+import re
+import subprocess
 from contextlib import ExitStack as does_not_raise
 from unittest import mock
 
+import formaldict
 import pytest
 
 from detail import core, exceptions
@@ -62,15 +69,54 @@ def test_load_note_schema(
         assert [s["label"] for s in schema] == expected_schema_labels
 
 
+def test_load_note_schema_cached(tmp_path):
+    """Tests core._load_note_schema() only reloads a schema file when it changes"""
+    user_schema_file = tmp_path / "schema.yaml"
+    user_schema_file.write_text(valid_schema)
+    os.utime(user_schema_file, ns=(0, 0))
+
+    schema = core._load_note_schema(path=user_schema_file)
+    assert core._load_note_schema(path=user_schema_file) is schema
+
+    user_schema_file.write_text("- label: summary")
+    new_schema = core._load_note_schema(path=user_schema_file)
+    assert [s["label"] for s in new_schema] == ["summary"]
+
+
 @pytest.mark.parametrize(
-    "sha, tag_match, git_describe_output, expected_git_call, expected_tag_value",
+    "sha, tag_match, git_output, expected_git_calls, expected_tag_value",
     [
-        ("sha1", None, "0.1~8", "git describe sha1 --contains", "0.1"),
+        (
+            "sha1",
+            None,
+            ["0.1~8"],
+            [
+                mock.call(
+                    "name-rev",
+                    "--name-only",
+                    "--tags",
+                    "sha1",
+                    check=False,
+                    stderr=subprocess.PIPE,
+                ),
+            ],
+            "0.1",
+        ),
         (
             "sha1",
             "pattern",
-            "",
-            "git describe sha1 --contains --match=pattern",
+            ["undefined"],
+            [
+                mock.call(
+                    "name-rev",
+                    "--name-only",
+                    "--tags",
+                    "--refs=refs/tags/pattern",
+                    "sha1",
+                    check=False,
+                    stderr=subprocess.PIPE,
+                )
+            ],
             "None",
         ),
     ],
@@ -79,35 +125,328 @@ def test_tag_from_sha(
     mocker,
     sha,
     tag_match,
-    git_describe_output,
-    expected_git_call,
+    git_output,
+    expected_git_calls,
     expected_tag_value,
 ):
     """Tests core.Tag.from_sha()"""
-    patched_describe = mocker.patch(
-        "detail.utils.shell_stdout",
+    mocker.patch("detail.utils.get_root", autospec=True, return_value=pathlib.Path("/work"))
+    patched_shell = mocker.patch(
+        "detail.utils.git_stdout",
         autospec=True,
-        return_value=git_describe_output,
+        side_effect=git_output,
     )
 
     assert str(core.Tag.from_sha(sha, tag_match=tag_match)) == expected_tag_value
-    assert patched_describe.call_args_list[0][0][0] == expected_git_call
+    assert patched_shell.call_args_list == expected_git_calls
 
 
 @pytest.mark.parametrize(
-    "git_log_output, expected_git_log_call, expected_date",
-    [("", mock.call("git log -1 --format=%ad 2.1"), None)],
+    "git_output, expected_date, expected_git_calls",
+    [
+        # Missing tags reload the cached tag dates
+        ("", None, 2),
+        ("1.0\t\t2026-10-15T08:25:38+00:00", None, 2),
+        ("2.1\t\t2026-10-15T08:25:38+00:00", "2026-10-15 08:25:38+00:00", 1),
+    ],
 )
-def test_tag_date(mocker, git_log_output, expected_git_log_call, expected_date):
+def test_tag_date(mocker, git_output, expected_date, expected_git_calls):
     """Tests core.Tag.date()"""
+    mocker.patch("detail.utils.get_root", autospec=True, return_value=pathlib.Path("/work"))
+    patched_shell = mocker.patch("detail.utils.git_stdout", autospec=True, return_value=git_output)
+    tag = core.Tag("2.1")
+    assert tag.data == "2.1"
+
+    assert str(tag.date) == str(expected_date)
+    assert str(tag.date) == str(expected_date)  # Run twice to exercise caching
+    assert patched_shell.call_count == expected_git_calls
+
+
+def test_tag_dates(mocker):
+    """Tests core._tag_dates()"""
+    mocker.patch("detail.utils.get_root", autospec=True, return_value=pathlib.Path("/work"))
     patched_shell = mocker.patch(
-        "detail.utils.shell_stdout", autospec=True, return_value=git_log_output
+        "detail.utils.git_stdout",
+        autospec=True,
+        return_value=(
+            "v1\t\t2026-10-15T08:25:38+00:00\n"
+            "v2\t2026-10-16T08:25:38+00:00\t2026-10-17T08:25:38+00:00\n"
+            "v3\t\tSun Oct 18 08:25:38 2026 +0000\n"
+            "tree\t"
+        ),
     )
-    tag = core.Tag("2.1")
 
-    assert tag.date == expected_date
-    assert tag.date == expected_date  # Run twice to exercise caching
-    assert patched_shell.call_args_list == [expected_git_log_call]
+    tag_dates = core._tag_dates()
+    assert str(tag_dates["v1"]) == "2026-10-15 08:25:38+00:00"
+    assert str(tag_dates["v2"]) == "2026-10-16 08:25:38+00:00"
+    assert str(tag_dates["v3"]) == "2026-10-18 08:25:38+00:00"
+    assert tag_dates["tree"] is None
+
+    # Dates are loaded once for all tags of a project
+    assert core.Tag("v1").date == core.Tag("v1").date == tag_dates["v1"]
+    assert core._tag_dates(["v2", "v3"]) is tag_dates
+    assert patched_shell.call_count == 1
+
+
+def test_commit():
+    """Tests core.Commit attribute and data access"""
+    commit = core.Commit({"sha": "sha1", "author_name": "Name"})
+    assert commit.sha == "sha1"
+    assert commit["author_name"] == "Name"
+    assert commit.author_email is None
+    assert commit.data == dict.fromkeys(core.CommitTable.fields) | {
+        "sha": "sha1",
+        "author_name": "Name",
+    }
+    with pytest.raises(AttributeError):
+        commit.invalid_attribute  # noqa
+    with pytest.raises(KeyError):
+        commit["invalid_key"]
+
+    commit_copy = copy.copy(commit)
+    assert commit_copy.sha == "sha1"
+
+
+def test_commit_table():
+    """Tests core.CommitTable returns one view per commit"""
+    table = core.CommitTable(fields=["sha", "author_name"])
+    table.append({"sha": "sha1", "author_name": "Name1"})
+    table.append({"sha": "sha2", "author_name": "Name2"})
+
+    assert list(table) == ["sha1", "sha2"]
+    assert table["sha1"] is table["sha1"]
+    assert table["sha2"].author_name == "Name2"
+
+
+def test_note():
+    """Tests core.Note data and attribute access"""
+    schema = formaldict.Schema([{"label": "type"}, {"label": "jira", "matches": "WEB-\\d+"}])
+    note = core.Note(
+        {"type": "bug", "jira": "INVALID"},
+        path="note.yaml",
+        schema=schema,
+        commit=core.Commit({"sha": "sha1"}),
+    )
+    assert len(note) == 2
+    assert dict(note) == {"type": "bug", "jira": "INVALID"}
+    assert note["type"] == note.type == "bug"
+    assert note.jira is None
+    assert note.commit_sha == "sha1"
+    assert not note.is_valid
+    with pytest.raises(AttributeError):
+        note.invalid_attribute  # noqa
+
+    note_copy = copy.copy(note)
+    assert note_copy.type == "bug"
+    assert note_copy.commit_sha == "sha1"
+
+    pickled_note = pickle.loads(pickle.dumps(note))
+    assert type(pickled_note) is core.Note
+    assert pickled_note.data == note.data
+    assert pickled_note.commit_sha == "sha1"
+
+
+def test_note_class():
+    """Tests core._note_class() stores schema labels in slots"""
+    schema = formaldict.Schema(
+        [
+            {"label": "type"},
+            {"label": "jira", "matches": "WEB-\\d+"},
+            {"label": "data", "required": False},
+            {"label": "not-an-identifier", "required": False},
+        ]
+    )
+    note_class = core._note_class(schema)
+    assert note_class is core._note_class(schema)
+    assert note_class.__slots__ == ("type", "jira")
+
+    note = note_class(
+        {"type": "bug", "jira": "INVALID", "not-an-identifier": "value"},
+        path="note.yaml",
+        schema=schema,
+    )
+    assert isinstance(note, core.Note)
+    assert note.type == note.type == "bug"
+    assert note.jira is None
+    assert note.data == {"type": "bug", "jira": "INVALID", "not-an-identifier": "value"}
+    assert getattr(note, "not-an-identifier") == "value"
+    with pytest.raises(AttributeError):
+        note.invalid_attribute  # noqa
+
+    empty_note = note_class({}, path="empty.yaml", schema=formaldict.Schema([]))
+    assert empty_note.type is None
+
+
+def test_note_validated_once(mocker):
+    """Tests core.Note only validates its data against the schema once"""
+    schema = formaldict.Schema([{"label": "type"}, {"label": "jira", "matches": "WEB-\\d+"}])
+    parse = mocker.spy(schema, "parse")
+    note = core.Note({"type": "bug", "jira": "INVALID"}, path="note.yaml", schema=schema)
+
+    for _ in range(2):
+        assert not note.is_valid
+        assert note.validation_errors
+        assert note.type == "bug"
+        assert note.jira is None
+
+    assert parse.call_count == 1
+
+
+def test_commit_tag(mocker):
+    """Tests core.Commit.tag with and without a tag index"""
+    patched_from_sha = mocker.patch.object(
+        core.Tag, "from_sha", autospec=True, return_value=core.Tag("v1")
+    )
+    commit = core.Commit({"sha": "sha1"}, tag_match="v*")
+    assert commit.tag == "v1"
+    assert commit.tag == "v1"  # Run twice to exercise caching
+    patched_from_sha.assert_called_once_with("sha1", tag_match="v*")
+
+    tag_index = core._TagIndex(["sha2", "sha3"])
+    tag_index.tags = {"sha2": core.Tag("v2")}
+    assert core.Commit({"sha": "sha2"}, tag_index=tag_index).tag == "v2"
+    assert core.Commit({"sha": "sha3"}, tag_index=tag_index).tag is None
+
+    # Commits missing from the index are looked up individually
+    assert core.Commit({"sha": "sha4"}, tag_index=tag_index).tag == "v1"
+    patched_from_sha.assert_called_with("sha4", tag_match=None)
+
+
+def test_tag_index(mocker):
+    """Tests core._TagIndex keeps tags aligned with shas that name-rev skips"""
+    mocker.patch("detail.utils.get_root", autospec=True, return_value=pathlib.Path("/work"))
+    patched_shell = mocker.patch(
+        "detail.utils.git_stdout",
+        autospec=True,
+        side_effect=["v1~1\nv2", "v1~1", "", "v2"],
+    )
+
+    tags = core._TagIndex(["sha1", "missing", "sha3"]).tags
+    assert tags == {"sha1": "v1", "sha3": "v2"}
+    assert patched_shell.call_args_list[1:] == [
+        mock.call("name-rev", "--name-only", "--tags", sha, check=False, stderr=subprocess.PIPE)
+        for sha in ["sha1", "missing", "sha3"]
+    ]
+
+
+@pytest.mark.parametrize(
+    "a, b, match, expected",
+    [
+        ("value", "value", False, True),
+        ("value", "other", False, False),
+        ("value", "val.*", True, True),
+        ("value", re.compile("val.*"), True, True),
+        ("value", "other", True, False),
+        (None, "val.*", True, False),
+        ("value\nother", r".*lue.*", True, True),
+        ("value\nother", r".*other.*", True, False),
+        ("value", r"value\.*", True, True),
+        ("value", r"value\\.*", True, False),
+    ],
+)
+def test_equals(a, b, match, expected):
+    """Tests core._equals()"""
+    assert core._equals(a, b, match=match) == expected
+
+
+@pytest.mark.parametrize(
+    "pattern, expected_pattern",
+    [
+        (r".*\[skip ci\].*", r".*\[skip ci\]"),
+        (r"value.*.*", "value"),
+        (r"value\.*", r"value\.*"),
+        (r"value\\.*", r"value\\"),
+    ],
+)
+def test_compile_pattern(pattern, expected_pattern):
+    """Tests core._compile_pattern() drops trailing ".*" wildcards"""
+    assert core._compile_pattern(pattern).pattern == expected_pattern
+
+
+def test_notes_columns():
+    """Tests that chained Notes calls look up each attribute once per note"""
+    schema = formaldict.Schema([{"label": "type"}, {"label": "team"}])
+    notes = core.Notes(
+        [
+            core.Note({"type": "bug", "team": "web"}, path="1.yaml", schema=schema),
+            core.Note({"type": "feature", "team": "web"}, path="2.yaml", schema=schema),
+            core.Note({"type": "bug", "team": "api"}, path="3.yaml", schema=schema),
+        ]
+    )
+
+    lookups = []
+    note_getattr = core.Note.__getattr__
+
+    def counted_getattr(note, attr):
+        lookups.append(attr)
+        return note_getattr(note, attr)
+
+    with mock.patch.object(core.Note, "__getattr__", counted_getattr):
+        # Filters are applied when the notes are first accessed
+        bugs = notes.filter("type", "bug")
+        unused = notes.exclude("team", "web").filter("type", "feature")
+        assert not lookups
+
+        assert [note.team for note in bugs] == ["web", "api"]
+        assert len(lookups) == 5
+
+        by_type = notes.group("type")
+        assert [len(group) for group in by_type.values()] == [2, 1]
+        assert len(lookups) == 5
+
+        # Only the "team" values of the filtered notes are looked up
+        assert [len(group) for group in bugs.exclude("team", "web").group("type").values()] == [1]
+        assert len(lookups) == 7
+
+    assert len(unused) == 0
+
+    # Groups are bucketed once per attribute and reordered for each call
+    assert list(notes.group("team", ascending_keys=True)) == ["api", "web"]
+    assert notes.group("team")["web"] is notes.group("team", descending_keys=True)["web"]
+
+
+def test_range_git_log(mocker):
+    """Tests core._range_git_log()"""
+    mocker.patch("detail.utils.get_root", autospec=True, return_value=pathlib.Path("/work"))
+    mocker.patch(
+        "detail.utils.get_detail_note_root",
+        autospec=True,
+        return_value=pathlib.Path("/work/.detail/notes"),
+    )
+    header = (
+        "<-------->\n"
+        "sha: {sha}\n"
+        "author_name: Name: With Colon\n"
+        "author_email: author@example.com\n"
+        "author_date: Thu Oct 15 08:25:38 2026 +0000\n"
+        "committer_name: Committer\n"
+        "committer_email: committer@example.com\n"
+        "committer_date: Thu Oct 15 08:25:38 2026 +0000"
+    )
+    patched_git = mocker.patch(
+        "detail.utils.git_stdout",
+        autospec=True,
+        side_effect=[
+            header.format(sha="1e100") + "\n" + header.format(sha="sha2"),
+            "<-------->\nsha: 1e100\n\n:000000 100644 0000000 6178079 A\t.detail/notes/note.yaml",
+        ],
+    )
+
+    commits, note_paths = core._range_git_log(["log"])
+    assert list(commits) == ["1e100", "sha2"]
+    assert commits["1e100"]["author_name"] == "Name: With Colon"
+    assert commits["1e100"].author_date == "Thu Oct 15 08:25:38 2026 +0000"
+    assert note_paths == [(".detail/notes/note.yaml", "1e100")]
+
+    # Notes are found with a log limited to the note root
+    assert patched_git.call_args_list[1] == mock.call(
+        "log",
+        "--diff-filter=A",
+        "--format=<-------->%nsha: %H",
+        "--raw",
+        "--",
+        "/work/.detail/notes",
+    )
 
 
 def test_get_pull_request_range(mocker):
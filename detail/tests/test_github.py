@@ -35,7 +35,7 @@ def test_get_org_and_repo_name(
     expected_exception,
 ):
     """Tests github.get_org_and_repo_name()"""
-    mocker.patch("detail.utils.shell_stdout", return_value=git_origin, autospec=True)
+    mocker.patch("detail.utils.git_stdout", return_value=git_origin, autospec=True)
     with expected_exception:
         org_name, repo_name = github.get_org_and_repo_name()
         assert org_name == expected_org_name
@@ -121,12 +121,12 @@ def test_get_pull_request(
 ):
     """Tests github.get_pull_request()"""
     mocker.patch(
-        "detail.utils.shell_stdout",
+        "detail.utils.git_stdout",
         autospec=True,
         side_effect=[
-            # The first shell call gets the git remote branch
+            # The first git call gets the git remote branch
             "git@github.com:jyveapp/random-repo.git",
-            # The second shell call gets the current git branch
+            # The second git call gets the current git branch
             "current_branch",
         ],
     )
@@ -3,7 +3,10 @@
 import io
 import os
 import pathlib
+import pickle
 import shutil
+import subprocess
+import time
 from contextlib import ExitStack as does_not_raise
 
 import formaldict
@@ -11,7 +14,7 @@ import jinja2.exceptions
 import pytest
 import yaml
 
-from detail import core, utils
+from detail import core, exceptions, utils
 
 
 @pytest.fixture()
@@ -92,56 +95,96 @@ def detail_config(tmp_path, mocker):
     yield tmp_path
 
 
-@pytest.fixture()
-def detail_repo(detail_config):
-    """Create a git repo with for integration tests"""
-    cwd = os.getcwd()
-    os.chdir(detail_config)
-
-    utils.shell("git init .")
-    utils.shell('git config user.email "you@example.com"')
-    utils.shell('git config user.name "Your Name"')
-
-    with open(utils.get_detail_note_root() / "note1.yaml", "w") as f:
-        f.write(
-            "summary: Summary1 [skip ci]\ndescription: Description1\n"
-            "type: api-break\njira: WEB-1111\n"
-        )
-
-    utils.shell("git add .")
-    utils.shell('git commit -m "commit"')
+def _fast_import(commits):
+    """
+    Create commits on the main branch in one "git fast-import" call.
 
-    with open(utils.get_detail_note_root() / "note2.yaml", "w") as f:
-        f.write("summary: Summary2\ndescription: Description2\ntype: bug\njira: WEB-1112\n")
+    Args:
+        commits (List[Tuple[Dict[str, str], str, List[str]]]): The files,
+            message, and tags of each commit.
+    """
+    identity = f"Your Name <you@example.com> {int(time.time())} +0000"
 
-    utils.shell("git add .")
-    utils.shell('git commit -m "commit"')
-    utils.shell("git tag v1.1")
+    def data(value):
+        value = value.encode("utf-8")
+        return b"data %d\n%s\n" % (len(value), value)
 
-    with open(utils.get_detail_note_root() / "note3.yaml", "w") as f:
-        f.write("summary: Summary3\ntype: trivial\n")
+    stream = b""
+    for mark, (files, message, tags) in enumerate(commits, start=1):
+        stream += f"commit refs/heads/main\nmark :{mark}\n".encode()
+        stream += f"author {identity}\ncommitter {identity}\n".encode()
+        stream += data(message)
+        for path, contents in files.items():
+            stream += f"M 100644 inline {path}\n".encode() + data(contents)
 
-    utils.shell("git add .")
-    utils.shell('git commit -m "commit"')
-    utils.shell("git tag dev1.2")
-    utils.shell("git tag v1.2")
+        for tag in tags:
+            stream += f"reset refs/tags/{tag}\nfrom :{mark}\n\n".encode()
 
-    with open(utils.get_detail_note_root() / "note4.yaml", "w") as f:
-        f.write("summary: Summary4\ndescription: Description4\ntype: feature\njira: WEB-1113\n")
+    subprocess.run(["git", "fast-import", "--quiet"], input=stream, check=True)
 
-    utils.shell("git add .")
-    utils.shell('git commit -m "commit"')
 
-    with open(utils.get_detail_note_root() / "note5.yaml", "w") as f:
-        f.write("summary: Invalid5\ndescription: Hi\ntype: feature\njira: INVALID\n")
+@pytest.fixture()
+def detail_repo(detail_config):
+    """Create a git repo with for integration tests"""
+    cwd = os.getcwd()
+    os.chdir(detail_config)
 
-    utils.shell("git add .")
-    utils.shell('git commit -m "commit"')
+    utils.shell("git init -q -b main .")
+    utils.shell('git config user.email "you@example.com"')
+    utils.shell('git config user.name "Your Name"')
 
-    utils.shell('git commit --allow-empty -m $"Invalid5\n\n' 'Type: feature\nJira: INVALID"')
-    # Create a commit that uses the same delimiter structure as detail
-    # to create a scenario of an unparseable commit.
-    # utils.shell('git commit --allow-empty -m $"Invalid6\n\nUnparseable: *{*"')
+    # The history is imported in one stream and then checked out
+    _fast_import(
+        [
+            (
+                {
+                    ".detail/schema.yaml": (detail_config / ".detail/schema.yaml").read_text(),
+                    ".detail/log.tpl": (detail_config / ".detail/log.tpl").read_text(),
+                    ".detail/notes/note1.yaml": (
+                        "summary: Summary1 [skip ci]\ndescription: Description1\n"
+                        "type: api-break\njira: WEB-1111\n"
+                    ),
+                },
+                "commit",
+                [],
+            ),
+            (
+                {
+                    ".detail/notes/note2.yaml": (
+                        "summary: Summary2\ndescription: Description2\ntype: bug\njira: WEB-1112\n"
+                    )
+                },
+                "commit",
+                ["v1.1"],
+            ),
+            (
+                {".detail/notes/note3.yaml": "summary: Summary3\ntype: trivial\n"},
+                "commit",
+                ["dev1.2", "v1.2"],
+            ),
+            (
+                {
+                    ".detail/notes/note4.yaml": (
+                        "summary: Summary4\ndescription: Description4\n"
+                        "type: feature\njira: WEB-1113\n"
+                    )
+                },
+                "commit",
+                [],
+            ),
+            (
+                {
+                    ".detail/notes/note5.yaml": (
+                        "summary: Invalid5\ndescription: Hi\ntype: feature\njira: INVALID\n"
+                    )
+                },
+                "commit",
+                [],
+            ),
+            ({}, "Invalid5\n\nType: feature\nJira: INVALID", []),
+        ]
+    )
+    utils.shell("git reset -q --hard")
 
     yield detail_config
 
@@ -307,8 +350,8 @@ def test_detail(mocker, input_data):
     path, entry = core.detail()
 
     assert entry.data == input_data
-    with open(path) as f:
-        assert yaml.safe_load(f.read()) == input_data
+    with open(path, "rb") as f:
+        assert yaml.safe_load(f) == input_data
 
 
 @pytest.mark.usefixtures("detail_repo")
@@ -337,8 +380,8 @@ def test_detail_update(mocker):
     assert new_path == path
 
     assert entry.data == update_data
-    with open(path) as f:
-        assert yaml.safe_load(f.read()) == update_data
+    with open(path, "rb") as f:
+        assert yaml.safe_load(f) == update_data
 
 
 @pytest.mark.usefixtures("detail_repo")
@@ -349,6 +392,22 @@ def test_lint():
     assert len(notes) == 5
     assert len(notes.commits) == 6
 
+    # Commit attributes that aren't loaded for linting are loaded on access,
+    # even after HEAD moves
+    assert "author_name" not in notes.commits.columns
+    utils.shell(
+        "git -c user.name=Other -c user.email=other@example.com commit -q --allow-empty -m Moved"
+    )
+    assert {commit.author_name for commit in notes.commits.values()} == {"Your Name"}
+    assert notes[0].commit_committer_email == "you@example.com"
+
+    # Notes of a range can be pickled
+    pickled_note = pickle.loads(pickle.dumps(notes[0]))
+    assert type(pickled_note).__slots__ == type(notes[0]).__slots__
+    assert pickled_note.data == notes[0].data
+    assert pickled_note.summary == notes[0].summary
+    assert pickled_note.commit_sha == notes[0].commit_sha
+
     passed, notes = core.lint(range="HEAD..")
     assert passed
     assert len(notes) == 0
@@ -360,6 +419,116 @@ def test_lint():
     assert len(notes.commits) == 1
 
 
+@pytest.mark.usefixtures("detail_repo")
+def test_note_range_cache(mocker):
+    """Tests that the git logs of note ranges are cached"""
+    range_git_log = mocker.spy(core, "_range_git_log")
+    cache_dir = utils.get_detail_root() / ".cache"
+
+    notes = core.NoteRange()
+    assert range_git_log.call_count == 1
+    assert (cache_dir / ".gitignore").read_text() == "*\n"
+    assert len(list(cache_dir.glob("*.json.gz"))) == 1
+
+    cached_notes = core.NoteRange()
+    assert range_git_log.call_count == 1
+    assert [note.data for note in cached_notes] == [note.data for note in notes]
+    assert dict(cached_notes.commits) == dict(notes.commits)
+    assert cached_notes[0].commit_tag == notes[0].commit_tag
+
+    # Different ranges and moved revisions aren't served from the cache
+    core.NoteRange(range="HEAD~1..")
+    assert range_git_log.call_count == 2
+    utils.shell('git commit --allow-empty -m "empty"')
+    assert len(core.NoteRange().commits) == len(notes.commits) + 1
+    assert range_git_log.call_count == 3
+
+    # Date ranges are never cached
+    core.NoteRange(before="tomorrow")
+    core.NoteRange(before="tomorrow")
+    assert range_git_log.call_count == 5
+    core.NoteRange(range='--since="2 weeks ago"')
+    core.NoteRange(range='--since="2 weeks ago"')
+    assert range_git_log.call_count == 7
+
+    # Corrupt cache files are ignored and caches that can't be written are skipped
+    for path in cache_dir.glob("*.json.gz"):
+        path.write_bytes(b"corrupt")
+    mocker.patch("os.replace", autospec=True, side_effect=OSError)
+    assert len(core.NoteRange()) == len(notes)
+    assert range_git_log.call_count == 8
+
+    # Only the most recent logs are kept
+    mocker.stopall()
+    mocker.patch.object(core, "_GIT_LOG_CACHE_SIZE", 1)
+    core.NoteRange(range="HEAD~2..")
+    assert len(list(cache_dir.glob("*.json.gz"))) == 1
+
+    # Projects without a detail root fail before anything is cached
+    shutil.rmtree(utils.get_detail_root())
+    with pytest.raises(exceptions.SchemaError):
+        core.lint()
+    core._write_git_log_cache(cache_dir / "log.json.gz", notes.commits, [])
+    assert not utils.get_detail_root().exists()
+
+
+@pytest.mark.usefixtures("detail_repo")
+def test_note_range_cache_shallow(tmp_path, mocker, monkeypatch):
+    """Tests that deepening a shallow clone invalidates cached git logs"""
+    clone = tmp_path / "clone"
+    utils.shell(f"git clone -q --depth 2 file://{tmp_path} {clone}")
+    monkeypatch.chdir(clone)
+    monkeypatch.setenv(core.NO_FETCH_ENV_VAR, "1")
+    utils.get_detail_root.return_value = clone / ".detail"
+
+    # The boundary commit of a shallow clone adds every note
+    notes = core.NoteRange()
+    assert len(notes.commits) == 2
+    assert len(notes) == 5
+
+    utils.shell("git fetch -q --unshallow")
+    notes = core.NoteRange()
+    assert len(notes.commits) == 6
+    assert len(notes) == 5
+    assert {note.commit_sha for note in notes} == set(list(notes.commits)[1:])
+
+
+@pytest.mark.usefixtures("detail_repo")
+def test_note_range_fetch(mocker, monkeypatch):
+    """Tests fetching remotes when creating note ranges"""
+    fetch = mocker.spy(core, "_fetch")
+    wait_for_fetch = mocker.spy(core, "_wait_for_fetch")
+
+    core.NoteRange()
+    assert fetch.call_count == 1
+    assert wait_for_fetch.call_count == 1
+
+    # Ranges wait on the fetch before reading the log since they may
+    # reference fetched refs
+    utils.shell("git update-ref refs/remotes/origin/main HEAD~2")
+    assert len(core.NoteRange(range="origin/main..")) == 1
+    assert wait_for_fetch.call_count == 3
+    assert len(core.NoteRange(range="HEAD~2..")) == 1
+    assert wait_for_fetch.call_count == 5
+
+    monkeypatch.setenv(core.NO_FETCH_ENV_VAR, "1")
+    core.NoteRange()
+    assert fetch.call_count == 3
+
+    monkeypatch.delenv(core.NO_FETCH_ENV_VAR)
+    utils.shell("git remote add origin does-not-exist")
+    with pytest.raises(subprocess.CalledProcessError):
+        core.NoteRange()
+
+    # The fetch is stopped when reading the log fails
+    running_fetch = subprocess.Popen(["sleep", "10"])
+    fetch.side_effect = lambda: running_fetch
+    mocker.patch.object(core, "_cached_range_git_log", autospec=True, side_effect=ValueError)
+    with pytest.raises(ValueError):
+        core.NoteRange()
+    assert running_fetch.returncode is not None
+
+
 @pytest.mark.parametrize("output", [None, "output_file", io.StringIO(), ":github/pr"])
 @pytest.mark.usefixtures("detail_repo")
 def test_log(output, mocker):
@@ -380,6 +549,18 @@ def test_log(output, mocker):
     assert "## Api-Break" in rendered
 
 
+@pytest.mark.usefixtures("detail_repo")
+def test_log_template():
+    """Tests core.log() with a template string"""
+    template = "{% for note in notes %}{{ note.summary }}\n{% endfor %}"
+    rendered = core.log(template=template)
+    assert rendered == "Invalid5\nSummary4\nSummary3\nSummary2\nSummary1 [skip ci]\n"
+
+    # Compiled template strings are reused
+    assert core.log(template=template) == rendered
+    assert core._compile_log_template.cache_info().hits >= 1
+
+
 @pytest.mark.parametrize(
     "style, expected_exception",
     [
@@ -417,3 +598,14 @@ def test_log_deleted_files():
     shutil.rmtree(".detail/notes")
     rendered = core.log()
     assert not rendered.strip()
+
+
+@pytest.mark.usefixtures("detail_repo")
+def test_load_notes_parallel(mocker):
+    """Tests loading notes in a process pool"""
+    notes = core.NoteRange()
+    (utils.get_detail_note_root() / "note1.yaml").unlink()
+
+    mocker.patch.object(core, "_PARALLEL_NOTE_THRESHOLD", 0)
+    parallel_notes = core.NoteRange()
+    assert [note.data for note in parallel_notes] == [note.data for note in notes[:-1]]
@@ -6,12 +6,23 @@ from detail import utils
 def test_shell_stdout():
     """Tests utils.shell_stdout()"""
     assert utils.shell_stdout('echo "hello world"') == "hello world"
+    assert utils.shell_stdout(["echo", "hello world"]) == "hello world"
+    assert utils.shell_stdout("echo $HOME") == "$HOME"
+    assert utils.shell_stdout(["printf", "  indented\n\n"]) == "  indented"
+    assert utils.shell_stdout(["printf", "caf\\303\\251 \\377"]) == "caf\u00e9 \ufffd"
+
+
+def test_shell(tmp_path):
+    """Tests utils.shell() runs commands through the shell when asked"""
+    output_path = tmp_path / "output"
+    utils.shell(f"echo hello > {output_path}", shell=True)
+    assert output_path.read_text() == "hello\n"
 
 
 def test_get_root(mocker):
     """Tests utils.get_root()"""
     mocker.patch(
-        "detail.utils.shell_stdout",
+        "detail.utils.git_stdout",
         autospec=True,
         # Return value for "git rev-parse --show-toplevel" call
         return_value="/work",
@@ -23,7 +34,7 @@ def test_get_root(mocker):
 def test_get_detail_schema_path(mocker):
     """Tests utils.get_detail_schema_path()"""
     mocker.patch(
-        "detail.utils.shell_stdout",
+        "detail.utils.git_stdout",
         autospec=True,
         # Return value for "git rev-parse --show-toplevel" call
         return_value="/work",
@@ -35,10 +46,34 @@ def test_get_detail_schema_path(mocker):
 def test_get_detail_note_root(mocker):
     """Tests utils.get_detail_note_root()"""
     mocker.patch(
-        "detail.utils.shell_stdout",
+        "detail.utils.git_stdout",
         autospec=True,
         # Return value for "git rev-parse --show-toplevel" call
         return_value="/work",
     )
 
     assert str(utils.get_detail_note_root()) == "/work/.detail/notes"
+
+
+def test_get_root_cached(mocker, tmp_path, monkeypatch):
+    """Tests utils.get_root() is cached per working directory"""
+    patched_git_stdout = mocker.patch(
+        "detail.utils.git_stdout", autospec=True, return_value="/work"
+    )
+
+    utils.get_root()
+    utils.get_detail_schema_path()
+    utils.get_detail_note_root()
+    assert patched_git_stdout.call_count == 1
+
+    monkeypatch.chdir(tmp_path)
+    utils.get_root()
+    assert patched_git_stdout.call_count == 2
+
+
+def test_git_stdout(tmp_path, monkeypatch):
+    """Tests utils.git_stdout()"""
+    monkeypatch.chdir(tmp_path)
+    utils.shell("git init -q .")
+    assert utils.git_stdout("rev-parse", "--show-toplevel") == str(tmp_path)
+    assert utils.git_stdout("rev-parse", "--verify", "-q", "HEAD", check=False) == ""
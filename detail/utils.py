@@ -2,26 +2,76 @@
 Utilities for detail
 """
 
+import functools
+import os
 import pathlib
+import shlex
 import subprocess
 
+# Detail paths relative to their parents. Joining with pure paths avoids
+# parsing the path strings on every call
+_DETAIL_DIR = pathlib.PurePath(".detail")
+_SCHEMA_FILE = pathlib.PurePath("schema.yaml")
+_NOTE_DIR = pathlib.PurePath("notes")
 
-def shell(cmd, check=True, stdin=None, stdout=None, stderr=None):
-    """Runs a subprocess shell with check=True by default"""
-    return subprocess.run(cmd, shell=True, check=check, stdin=stdin, stdout=stdout, stderr=stderr)
+
+def shell(
+    cmd, check=True, stdin=None, stdout=None, stderr=None, shell=False, encoding=None, errors=None
+):
+    """
+    Runs a subprocess with check=True by default. Commands given as a string
+    are split into arguments with shell syntax and executed directly, unless
+    ``shell`` is True, in which case they run through the system shell.
+    Output is decoded as text when an ``encoding`` is given
+    """
+    if isinstance(cmd, str) and not shell:
+        cmd = shlex.split(cmd)
+
+    return subprocess.run(
+        cmd,
+        shell=shell,
+        check=check,
+        stdin=stdin,
+        stdout=stdout,
+        stderr=stderr,
+        encoding=encoding,
+        errors=errors,
+    )
 
 
 def shell_stdout(cmd, check=True, stdin=None, stderr=None):
     """Runs a shell command and returns stdout"""
-    ret = shell(cmd, stdout=subprocess.PIPE, check=check, stdin=stdin, stderr=stderr)
-    return ret.stdout.decode("utf-8").strip() if ret.stdout else ""
+    ret = shell(
+        cmd,
+        stdout=subprocess.PIPE,
+        check=check,
+        stdin=stdin,
+        stderr=stderr,
+        encoding="utf-8",
+        errors="replace",
+    )
+    # Only the trailing newlines of command output are insignificant
+    return ret.stdout.rstrip("\n")
+
+
+def git_stdout(*args, check=True, stderr=None):
+    """Runs a git command with the given arguments and returns stdout"""
+    return shell_stdout(["git", *args], check=check, stderr=stderr)
 
 
 def get_root():
     """
     Get the root path in the git project
     """
-    top_level = shell_stdout("git rev-parse --show-toplevel")
+    return _get_root(os.getcwd())
+
+
+@functools.lru_cache(maxsize=None)
+def _get_root(cwd):
+    """
+    Get and cache the root path of the git project of a working directory
+    """
+    top_level = git_stdout("rev-parse", "--show-toplevel")
     return pathlib.Path(top_level)
 
 
@@ -29,18 +79,18 @@ def get_detail_root():
     """
     Get the detail storage path in the git project
     """
-    return get_root() / ".detail"
+    return get_root() / _DETAIL_DIR
 
 
 def get_detail_schema_path():
     """
     Get the default schema path
     """
-    return get_detail_root() / "schema.yaml"
+    return get_detail_root() / _SCHEMA_FILE
 
 
 def get_detail_note_root():
     """
     The root path where notes are stored
     """
-    return get_detail_root() / "notes"
+    return get_detail_root() / _NOTE_DIR